@@ -18,18 +18,153 @@ CONVERTED TO: Nautobot Job (this file)
 See: SCRIPT_TO_JOB_CONVERSION.md for detailed conversion guide
 """
 
+import asyncio
+import logging
+import os
+import traceback
+
+from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
+
+from django.db.models import QuerySet
 from nautobot.apps.jobs import Job, MultiObjectVar, BooleanVar, register_jobs
-from nautobot.dcim.models import Device
-from jinja2 import Environment, BaseLoader
+from nautobot.dcim.models import Device, Interface
+from nautobot.extras.choices import SecretsGroupAccessTypeChoices, SecretsGroupSecretTypeChoices
+from nautobot.extras.models import SecretsGroupAssociation
+from nautobot.ipam.models import IPAddress
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
 
 try:
-    import pyeapi
-    PYEAPI_AVAILABLE = True
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
 except ImportError:
-    PYEAPI_AVAILABLE = False
+    AIOHTTP_AVAILABLE = False
 
 name = "Network Fixes"
 
+# Optional directory for the compiled template bytecode cache, shared between
+# worker (re)starts. Unset (default) means no bytecode cache.
+JINJA_BYTECODE_CACHE_DIR = os.getenv("JINJA_BYTECODE_CACHE_DIR")
+
+logger = logging.getLogger(__name__)
+
+# Device credentials - secrets are resolved through the device's secrets
+# group. Resolving a secret can hit an external backend (environment,
+# vault, ...), so values are cached per (secrets group, access type, secret
+# type) for runs over many devices. Secrets whose parameters are templated
+# on the device are resolved per device (with obj=device) and never cached.
+# The cache is cleared at the start and end of each run, so rotated secrets
+# are picked up and plaintext values don't outlive the job.
+DEFAULT_USERNAME = "admin"
+DEFAULT_PASSWORD = "admin"
+
+
+def _is_templated(secret):
+    """Check whether a secret's parameters depend on the object (Jinja2 syntax)."""
+    return any("{{" in str(value) or "{%" in str(value) for value in (secret.parameters or {}).values())
+
+
+@lru_cache(maxsize=64)
+def _get_secret(secrets_group_id, access_type, secret_type):
+    """
+    Get (secret, value) for a secrets group (cached).
+
+    value is None for templated secrets, which must be resolved per device.
+    """
+    secret = SecretsGroupAssociation.objects.select_related("secret").get(
+        secrets_group_id=secrets_group_id,
+        access_type=access_type,
+        secret_type=secret_type,
+    ).secret
+    if _is_templated(secret):
+        return secret, None
+    return secret, secret.get_value()
+
+
+def _get_secret_value(device, access_type, secret_type):
+    """Get a secret value from the device's secrets group."""
+    secret, value = _get_secret(device.secrets_group_id, access_type, secret_type)
+    if value is None:
+        # Templated secret - resolve with the device as template context
+        return secret.get_value(obj=device)
+    return value
+
+
+def _clear_credentials_cache():
+    """Forget all cached secret values."""
+    _get_secret.cache_clear()
+
+
+def _resolve_credentials(device, log):
+    """
+    Get (username, password) for a device.
+
+    Uses the device's secrets group when configured, falling back to the
+    default credentials (admin/admin) for anything that can't be retrieved.
+    """
+    username = DEFAULT_USERNAME
+    password = DEFAULT_PASSWORD
+
+    if device.secrets_group_id:
+        try:
+            username = _get_secret_value(
+                device,
+                SecretsGroupAccessTypeChoices.TYPE_GENERIC,
+                SecretsGroupSecretTypeChoices.TYPE_USERNAME,
+            ) or DEFAULT_USERNAME
+        except Exception as e:
+            username = DEFAULT_USERNAME
+            log.warning(
+                f"Could not retrieve username for {device.name} from secrets "
+                f"({type(e).__name__}: {e}), using default"
+            )
+
+        try:
+            password = _get_secret_value(
+                device,
+                SecretsGroupAccessTypeChoices.TYPE_GENERIC,
+                SecretsGroupSecretTypeChoices.TYPE_PASSWORD,
+            ) or DEFAULT_PASSWORD
+        except Exception as e:
+            password = DEFAULT_PASSWORD
+            log.warning(
+                f"Could not retrieve password for {device.name} from secrets "
+                f"({type(e).__name__}: {e}), using default"
+            )
+
+    return username, password
+
+
+def _chunked(iterable, size):
+    """Yield lists of up to size items from iterable."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class _BufferedLogger:
+    """
+    Collect log messages for one device and flush them in one go.
+
+    Per-device output is collected while devices are prepared and pushed,
+    then flushed outside the event loop (Django doesn't allow the JobLogEntry
+    writes from inside it), one device after the other, so the output of
+    each device stays together in the job log instead of being interleaved.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def __getattr__(self, level):
+        # info(), warning(), error(), success(), debug(), ...
+        return lambda message, *args, **kwargs: self.records.append((level, message, args, kwargs))
+
+    def flush(self, logger):
+        for level, message, args, kwargs in self.records:
+            getattr(logger, level)(message, *args, **kwargs)
+        self.records = []
+
 
 class FixNetworkConnectivity(Job):
     """
@@ -69,62 +204,106 @@ class FixNetworkConnectivity(Job):
         required=False,
     )
 
-    # Same template as original script
-    TEMPLATE = """
+    # Upper bound of concurrent eAPI requests (pushes are I/O bound)
+    MAX_CONNECTIONS = 16
+
+    # Above this many devices, stream them from the database in chunks
+    # instead of loading the whole inventory into memory
+    ITERATOR_THRESHOLD = 500
+    ITERATOR_CHUNK_SIZE = 200
+
+    # Same template as original script, specialized for the single Ethernet2
+    # interface (flat variables instead of a device dict + interfaces loop).
+    # A device has at most one Ethernet2: interface names are unique per
+    # device in Nautobot, and _get_interfaces_by_device keys them by name.
+    # The "!" comment lines are only rendered for the preview; without them
+    # the output is exactly the list of commands pushed to the device.
+    TEMPLATE = """\
+{% if preview %}
 !
 ! === FIX: Enable Ethernet2 interfaces ===
 !
-{% for iface in device.interfaces %}
-interface {{ iface.name }}
-  description {{ iface.description }}
+{% endif %}
+interface {{ iface_name }}
+  description {{ iface_desc }}
   switchport mode access
-  switchport access vlan {{ iface.vlan }}
+  switchport access vlan {{ iface_vlan }}
   no shutdown
+{% if preview %}
 !
-{% endfor %}
 !
-! === Add Loopback interface (for {{ device.name }}) ===
+! === Add Loopback interface (for {{ name }}) ===
 !
+{% endif %}
 interface Loopback0
-  description {{ device.name }} Loopback - Reachable from data plane
-  ip address {{ device.loopback_ip }}/32
+  description {{ name }} Loopback - Reachable from data plane
+  ip address {{ loopback_ip }}/32
   no shutdown
+{% if preview %}
 !
+{% endif %}
 end
 """
 
     def run(self, devices=None, dry_run=True, commit_changes=True):
         """Main execution method."""
         
-        # Check if pyeapi is available
-        if not PYEAPI_AVAILABLE:
-            self.logger.error("pyeapi library is not installed")
-            self.logger.error("Install with: pip install pyeapi")
+        # Check if aiohttp (eAPI client) is available
+        if not AIOHTTP_AVAILABLE:
+            self.logger.error("aiohttp library is not installed")
+            self.logger.error("Install with: pip install aiohttp")
             return
 
-        self.logger.info("=" * 80)
-        self.logger.info("Fix Network Connectivity Job")
-        self.logger.info("=" * 80)
+        # Each logger call is a JobLogEntry row - group informational lines
+        self.logger.info("\n".join(["=" * 80, "Fix Network Connectivity Job", "=" * 80]))
+
+        # Resolve secrets once per job run (shared across devices), and don't
+        # keep them in worker memory once the job is done
+        _clear_credentials_cache()
+        try:
+            self._configure_devices(devices, dry_run, commit_changes)
+        finally:
+            _clear_credentials_cache()
 
+    def _configure_devices(self, devices, dry_run, commit_changes):
+        """Discover/validate the devices, render and push their configuration."""
         # If no devices specified, auto-discover
         if not devices:
             self.logger.info("No devices specified - auto-discovering Arista devices with Ethernet2...")
-            devices = self._discover_devices()
+            devices, device_count = self._discover_devices()
+        else:
+            if isinstance(devices, QuerySet):
+                # Selected devices: load platform/primary IP with the devices
+                devices = devices.select_related("platform", "primary_ip4")
+            device_count = devices.count() if isinstance(devices, QuerySet) else len(devices)
         
-        if not devices:
+        if not device_count:
             self.logger.warning("No devices found to configure")
             return
 
-        self.logger.info(f"Found {len(devices)} device(s) to configure")
-        self.logger.info("")
+        self.logger.info(f"Found {device_count} device(s) to configure\n")
+
+        # Large inventories are streamed from the database in chunks
+        if isinstance(devices, QuerySet) and device_count > self.ITERATOR_THRESHOLD:
+            device_chunks = _chunked(devices.iterator(chunk_size=self.ITERATOR_CHUNK_SIZE), self.ITERATOR_CHUNK_SIZE)
+        else:
+            device_chunks = [list(devices)]
+
+        for chunk in device_chunks:
+            # Prepare devices (database + rendering) here, then push all
+            # configs of the chunk concurrently from this thread with asyncio
+            prepared = self._prepare_chunk(chunk, dry_run)
+            pushes = [(device, push_args) for device, push_args, _ in prepared if push_args is not None]
+            push_buffers = iter(asyncio.run(self._push_configs_async(pushes, commit_changes)) if pushes else [])
 
-        # Process each device
-        for device in devices:
-            self._process_device(device, dry_run, commit_changes)
+            # Log outside the event loop, each device's push output directly
+            # following its preparation output
+            for _, push_args, buffer in prepared:
+                buffer.flush(self.logger)
+                if push_args is not None:
+                    next(push_buffers).flush(self.logger)
 
-        self.logger.info("=" * 80)
-        self.logger.success(f"Completed processing {len(devices)} device(s)")
-        self.logger.info("=" * 80)
+        self.logger.success("\n".join(["=" * 80, f"Completed processing {device_count} device(s)", "=" * 80]))
 
     def _discover_devices(self):
         """
@@ -132,116 +311,214 @@ end
         
         Finds Arista devices with Ethernet2 interfaces.
         This replaces the hardcoded ARISTA_DEVICES list from the script.
+        Returns (devices, device_count): a list for small inventories, the
+        queryset (to be streamed by run) above ITERATOR_THRESHOLD.
         """
-        from nautobot.dcim.models import Interface
-        
-        # Find Arista devices with Ethernet2 interface
+        # Find Arista devices with Ethernet2 interface, loading the related
+        # platform and primary IP up front (avoids N+1); interfaces are
+        # fetched in bulk by _get_interfaces_by_device.
+        # Only the columns used by this job are loaded (name, platform name
+        # and primary IP) - no need to hydrate every Device/Platform field.
         devices = Device.objects.filter(
             platform__name__icontains="Arista",
             interfaces__name="Ethernet2"
+        ).select_related(
+            "platform", "primary_ip4"
+        ).only(
+            "id",
+            "name",
+            "secrets_group",
+            "platform__name",
+            "primary_ip4__host",
+            "primary_ip4__mask_length",
         ).distinct()
 
-        self.logger.info(f"Auto-discovered {devices.count()} Arista device(s) with Ethernet2")
-        
-        for device in devices:
-            self.logger.info(f"  - {device.name} ({device.primary_ip4.address if device.primary_ip4 else 'No IP'})")
+        # Count once and decide: large inventories are returned as a
+        # queryset so run() can stream them, small ones are loaded here
+        device_count = devices.count()
+        if device_count > self.ITERATOR_THRESHOLD:
+            self.logger.info(f"Auto-discovered {device_count} Arista device(s) with Ethernet2")
+            return devices, device_count
+
+        devices = list(devices)
+        self.logger.info("\n".join(
+            [f"Auto-discovered {device_count} Arista device(s) with Ethernet2"]
+            + [
+                f"  - {device.name} ({device.primary_ip4.address if device.primary_ip4 else 'No IP'})"
+                for device in devices
+            ]
+        ))
         
-        return devices
+        return devices, device_count
 
-    def _process_device(self, device, dry_run, commit_changes):
-        """Process a single device."""
-        self.logger.info("-" * 80)
-        self.logger.info(f"Processing device: {device.name}")
+    def _get_interfaces_by_device(self, devices):
+        """
+        Fetch the Ethernet2 interfaces of all devices at once.
+
+        Returns {device_id: {interface_name: Interface}} so the per-device
+        helpers don't need to query the database again. The cable path and
+        its destination are loaded too, for eth2.connected_endpoint.
+        """
+        interfaces_by_device = defaultdict(dict)
+        interfaces = Interface.objects.filter(
+            device__in=devices,
+            name="Ethernet2",
+        ).select_related("untagged_vlan", "_path").prefetch_related("_path__destination")
+        for interface in interfaces:
+            # (device, name) is unique, so each device maps to one Ethernet2
+            interfaces_by_device[interface.device_id][interface.name] = interface
+        return interfaces_by_device
+
+    def _bulk_loopback_ips(self, devices):
+        """
+        Fetch the existing Loopback0 IP of all devices in a single query.
+
+        Returns {device_id: ip}; devices without a Loopback0 IP are missing.
+        """
+        loopback_ips = {}
+        ip_addresses = IPAddress.objects.filter(
+            interfaces__device__in=devices,
+            interfaces__name="Loopback0",
+        ).values_list("interfaces__device_id", "host")
+        for device_id, host in ip_addresses:
+            # Keep the first IP found, same as the previous per-device lookup
+            loopback_ips.setdefault(device_id, str(host))
+        return loopback_ips
+
+    @property
+    def _device_logger(self):
+        """Logger for per-device output (a _BufferedLogger while one is active)."""
+        return getattr(self, "_log_buffer", None) or self.logger
+
+    def _buffered(self, func, *args):
+        """Call func with its per-device output buffered; returns (result, buffer)."""
+        buffer = _BufferedLogger()
+        self._log_buffer = buffer
+        try:
+            return func(*args), buffer
+        finally:
+            self._log_buffer = None
+
+    def _prepare_chunk(self, chunk, dry_run):
+        """
+        Prepare a chunk of devices on the job's thread.
+
+        Loads the interfaces and loopback IPs of the chunk at once, then
+        validates and renders each device. Returns a list of
+        (device, push_args or None, buffer) - see _prepare_device.
+        """
+        interfaces_by_device = self._get_interfaces_by_device(chunk)
+        loopback_ips = self._bulk_loopback_ips(chunk)
+        prepared = []
+        for device in chunk:
+            push_args, buffer = self._buffered(
+                self._prepare_device, device, interfaces_by_device[device.id], loopback_ips.get(device.id), dry_run
+            )
+            prepared.append((device, push_args, buffer))
+        return prepared
+
+    def _prepare_device(self, device, interfaces, loopback_ip, dry_run):
+        """
+        Validate a device and render its configuration.
+
+        interfaces is the {name: Interface} map of the device and loopback_ip
+        its existing Loopback0 IP (or None), both fetched in bulk.
+
+        Returns (username, password, config_cmds) to push, or None when the
+        device is skipped or in dry run mode. Everything that may need the
+        database (including credentials) is resolved here, so pushing
+        doesn't.
+        """
+        self._device_logger.info("\n".join(["-" * 80, f"Processing device: {device.name}"]))
         
         # Validate device
-        if not self._validate_device(device):
-            return
-        
-        # Get device data for template
-        device_data = self._get_device_data(device)
+        if not self._validate_device(device, interfaces):
+            return None
         
-        # Render configuration
-        rendered_config = self._render_config(device_data)
+        # Render configuration from the device data - the commented preview
+        # in dry run mode, otherwise exactly the commands that get pushed
+        # (one render either way)
+        rendered_config = self._render_device_config(device, interfaces, loopback_ip, preview=dry_run)
         
-        # Show rendered configuration
-        self.logger.info("Rendered configuration:")
-        self.logger.info("-" * 80)
-        self.logger.info(rendered_config)
-        self.logger.info("-" * 80)
+        # Show rendered configuration (single log entry per device)
+        self._device_logger.info("\n".join([
+            "Rendered configuration:",
+            "-" * 80,
+            rendered_config,
+            "-" * 80,
+        ]))
         
         # Push to device (if not dry run)
         if dry_run:
-            self.logger.warning(f"DRY RUN mode - configuration NOT pushed to {device.name}")
-            self.logger.info("Run again with 'Dry run' unchecked to apply changes")
-        else:
-            self._push_config_to_device(device, rendered_config, commit_changes)
+            self._device_logger.warning(
+                f"DRY RUN mode - configuration NOT pushed to {device.name}\n"
+                "Run again with 'Dry run' unchecked to apply changes"
+            )
+            return None
+        username, password = _resolve_credentials(device, self._device_logger)
+        return username, password, rendered_config.splitlines()
+
+    def _validate_device(self, device, interfaces):
+        """
+        Validate device has required attributes.
 
-    def _validate_device(self, device):
-        """Validate device has required attributes."""
+        All checks work on already loaded data, so skipped devices don't
+        cost any extra database queries.
+        """
         
-        # Check platform
+        # Check platform (filters out non-Arista devices in mixed inventories)
         if not device.platform or "arista" not in device.platform.name.lower():
-            self.logger.warning(f"Device {device.name} is not Arista platform - skipping")
+            self._device_logger.warning(f"Device {device.name} is not Arista platform - skipping")
             return False
         
-        # Check primary IP
-        if not device.primary_ip4:
-            self.logger.error(f"Device {device.name} has no primary IPv4 address - skipping")
+        # Check primary IP (FK id only, the IP itself is loaded when needed)
+        if not device.primary_ip4_id:
+            self._device_logger.error(f"Device {device.name} has no primary IPv4 address - skipping")
             return False
         
-        # Check has Ethernet2
-        if not device.interfaces.filter(name="Ethernet2").exists():
-            self.logger.warning(f"Device {device.name} has no Ethernet2 interface - skipping")
+        # Check has Ethernet2 (in-memory lookup, see _get_interfaces_by_device)
+        if "Ethernet2" not in interfaces:
+            self._device_logger.warning(f"Device {device.name} has no Ethernet2 interface - skipping")
             return False
         
         return True
 
-    def _get_device_data(self, device):
+    def _render_device_config(self, device, interfaces, loopback_ip, preview):
         """
-        Get device data for template rendering.
+        Get device data for template rendering and render it.
         
         This replaces the hardcoded device dictionaries from the script.
-        Data is now pulled from Nautobot database.
+        Data is now pulled from Nautobot database and passed to
+        _render_config as scalars, without building a device dict.
         """
-        from nautobot.dcim.models import Interface
-        
         # Get Ethernet2 interface
-        eth2 = device.interfaces.get(name="Ethernet2")
+        eth2 = interfaces["Ethernet2"]
         
         # Get VLAN from interface (untagged_vlan for access ports)
         vlan_id = "10"  # Default
         if eth2.untagged_vlan:
             vlan_id = str(eth2.untagged_vlan.vid)
         
-        # Build device data structure (same format as original script)
-        device_data = {
-            "name": device.name,
-            "host": str(device.primary_ip4.address.ip),
-            "loopback_ip": self._get_loopback_ip(device),
-            "interfaces": [
-                {
-                    "name": eth2.name,
-                    "description": eth2.description or f"Connected to {eth2.connected_endpoint}" if eth2.connected_endpoint else "Data interface",
-                    "mode": "access",
-                    "vlan": vlan_id,
-                }
-            ],
-        }
-        
-        return device_data
-
-    def _get_loopback_ip(self, device):
+        # Only the scalar values used by the template
+        return self._render_config(
+            name=device.name,
+            loopback_ip=self._get_loopback_ip(device, loopback_ip),
+            iface_name=eth2.name,
+            iface_desc=eth2.description or f"Connected to {eth2.connected_endpoint}" if eth2.connected_endpoint else "Data interface",
+            iface_vlan=vlan_id,
+            preview=preview,
+        )
+
+    def _get_loopback_ip(self, device, loopback_ip):
         """
         Get or assign loopback IP for device.
         
         In the original script, this was hardcoded.
         Here we could pull from Nautobot or calculate it.
         """
-        # Check if device already has a loopback interface with IP
-        loopback = device.interfaces.filter(name="Loopback0").first()
-        if loopback and loopback.ip_addresses.exists():
-            # Use existing loopback IP
-            return str(loopback.ip_addresses.first().address.ip)
+        # Use the existing Loopback0 IP (see _bulk_loopback_ips)
+        if loopback_ip:
+            return loopback_ip
         
         # Otherwise, assign based on device name pattern (same as original script)
         loopback_mapping = {
@@ -253,62 +530,148 @@ end
         
         return loopback_mapping.get(device.name, "10.99.99.99")
 
-    def _render_config(self, device_data):
+    def _render_config(self, name, loopback_ip, iface_name, iface_desc, iface_vlan, preview=True):
         """
         Render Jinja2 template with device data.
         
-        Same template logic as original script.
+        Same template logic as original script. The template is compiled
+        once at module load (see _COMPILED_TEMPLATE) instead of per device.
+        With preview=False only the executable commands are rendered, one
+        per line.
+        """
+        return _COMPILED_TEMPLATE.render(
+            name=name,
+            loopback_ip=loopback_ip,
+            iface_name=iface_name,
+            iface_desc=iface_desc,
+            iface_vlan=iface_vlan,
+            preview=preview,
+        )
+
+    def _build_eapi_commands(self, config_cmds, commit_changes):
+        """
+        Wrap config commands for a single eAPI request.
+
+        Batches configure + config + end (+ write memory) into one request
+        instead of one round-trip per step.
+        """
+        commands = ["configure"] + config_cmds
+        if commands[-1] != "end":
+            commands.append("end")
+        if commit_changes:
+            commands.append("write memory")
+        return commands
+
+    async def _push_configs_async(self, pushes, commit_changes):
         """
-        env = Environment(loader=BaseLoader(), trim_blocks=True, lstrip_blocks=True)
-        template = env.from_string(self.TEMPLATE)
-        rendered = template.render(device=device_data)
-        return rendered
+        Push configurations to many devices concurrently via eAPI (aiohttp).
 
-    def _push_config_to_device(self, device, rendered_config, commit_changes):
+        pushes is a list of (device, (username, password, config_cmds)).
+        At most MAX_CONNECTIONS requests are in flight at once. Returns one
+        _BufferedLogger per device, to be flushed by the caller.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONNECTIONS)
+        # eAPI uses self-signed certificates by default (not verified by the
+        # original script's pyeapi connection either)
+        connector = aiohttp.TCPConnector(ssl=False, limit=self.MAX_CONNECTIONS)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(*[
+                self._push_config_async(session, semaphore, device, username, password, config_cmds, commit_changes)
+                for device, (username, password, config_cmds) in pushes
+            ])
+
+    async def _push_config_async(self, session, semaphore, device, username, password, config_cmds, commit_changes):
         """
         Push configuration to device via eAPI.
         
-        Same as original script's push_config() function.
+        Same as original script's push_config() function, with the commands
+        sent as a single JSON-RPC request.
         """
+        log = _BufferedLogger()
         host = str(device.primary_ip4.address.ip)
-        
-        self.logger.info(f"Connecting to {device.name} at {host}...")
-        
+
+        log.info(f"Connecting to {device.name} at {host}...")
+
         try:
-            # Connect to device (same as original script)
-            connection = pyeapi.connect(
-                transport="https",
-                host=host,
-                username="admin",
-                password="admin",
-                port=443,
-            )
-            node = pyeapi.client.Node(connection)
-            
-            # Filter out empty lines and comments (same as original)
-            config_cmds = [
-                line for line in rendered_config.splitlines()
-                if line.strip() and not line.strip().startswith("!")
-            ]
-            
             if config_cmds:
-                # Push configuration
-                node.config(config_cmds)
-                self.logger.success(f"Configuration pushed to {device.name}")
-                
+                payload = {
+                    "jsonrpc": "2.0",
+                    "method": "runCmds",
+                    "params": {
+                        "version": 1,
+                        "cmds": ["enable"] + self._build_eapi_commands(config_cmds, commit_changes),
+                        "format": "json",
+                    },
+                    "id": device.name,
+                }
+                async with semaphore:
+                    async with session.post(
+                        f"https://{host}:443/command-api",
+                        json=payload,
+                        auth=aiohttp.BasicAuth(username, password),
+                    ) as response:
+                        response.raise_for_status()
+                        result = await response.json(content_type=None)
+
+                if "error" in result:
+                    error = result["error"]
+                    raise RuntimeError(error.get("message", error) if isinstance(error, dict) else error)
+
+                log.success(f"Configuration pushed to {device.name}")
+
                 # Save configuration (if requested)
                 if commit_changes:
-                    node.enable("write memory")
-                    self.logger.success(f"Configuration saved on {device.name}")
+                    log.success(f"Configuration saved on {device.name}")
                 else:
-                    self.logger.warning(f"Configuration NOT saved (write memory skipped)")
+                    log.warning(f"Configuration NOT saved (write memory skipped)")
             else:
-                self.logger.warning("No configuration commands to push")
+                log.warning("No configuration commands to push")
 
         except Exception as e:
-            self.logger.error(f"Failed to configure {device.name}: {e}")
-            import traceback
-            self.logger.debug(traceback.format_exc())
+            log.error(f"Failed to configure {device.name}: {e}")
+            log.debug(traceback.format_exc())
+
+        return log
+
+
+def _load_template(bytecode_cache_dir):
+    """
+    Compile the job template, using the bytecode cache when configured.
+
+    The template is loaded by name so Jinja2 can store its compiled bytecode
+    in the cache and skip parsing/compiling on the next worker start (the
+    cache key includes a checksum of the source, so template changes are
+    picked up). Any problem with the cache directory falls back to compiling
+    without a cache - it must never prevent the job from registering.
+    """
+    def load(bytecode_cache):
+        return Environment(
+            loader=DictLoader({"fix_connectivity": FixNetworkConnectivity.TEMPLATE}),
+            bytecode_cache=bytecode_cache,
+            auto_reload=False,
+            trim_blocks=True,
+            lstrip_blocks=True,
+        ).get_template("fix_connectivity")
+
+    if bytecode_cache_dir:
+        try:
+            # Marshalled bytecode is loaded (executed) from this directory, so
+            # it must be ours and not writable by other users (same checks as
+            # Jinja2's default cache directory)
+            os.makedirs(bytecode_cache_dir, mode=0o700, exist_ok=True)
+            cache_dir_stat = os.stat(bytecode_cache_dir)
+            if cache_dir_stat.st_uid != os.getuid():
+                raise OSError(f"{bytecode_cache_dir} is not owned by the current user")
+            if cache_dir_stat.st_mode & 0o022:
+                raise OSError(f"{bytecode_cache_dir} is writable by group/other users")
+            return load(FileSystemBytecodeCache(bytecode_cache_dir))
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Jinja2 bytecode cache disabled: {e}")
+    return load(None)
+
+
+# Compile the constant template once and reuse it for every device
+_COMPILED_TEMPLATE = _load_template(JINJA_BYTECODE_CACHE_DIR)
 
 
 # Register the job with Nautobot
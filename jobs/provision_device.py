@@ -9,13 +9,31 @@ This job provisions a device by:
 
 from nautobot.apps.jobs import Job, ObjectVar, BooleanVar, register_jobs
 from nautobot.dcim.models import Device
+from nautobot.extras.choices import SecretsGroupAccessTypeChoices, SecretsGroupSecretTypeChoices
 from napalm import get_network_driver
 from napalm.base.exceptions import ConnectionException, CommitError, ReplaceConfigException
+import json
 import traceback
 
+try:
+    from nautobot_golden_config.models import GoldenConfig
+    GOLDEN_CONFIG_AVAILABLE = True
+except ImportError:
+    GOLDEN_CONFIG_AVAILABLE = False
+
 name = "Device Provisioning"
 
 
+def _first_lines(text, count):
+    """Return the first count lines of text without splitting all of it."""
+    end = -1
+    for _ in range(count):
+        end = text.find("\n", end + 1)
+        if end == -1:
+            return text
+    return text[:end]
+
+
 class ProvisionDevice(Job):
     """
     Provision a device with its intended configuration from Golden Config.
@@ -70,10 +88,15 @@ class ProvisionDevice(Job):
         """Main execution method."""
         # Store debug flag for use in helper methods
         self._show_debug = show_debug
+
+        # Re-fetch the device with its related objects in a single query, so
+        # the platform/IP/secrets group lookups below don't each hit the DB
+        device = Device.objects.select_related(
+            "platform", "primary_ip4", "secrets_group"
+        ).get(pk=device.pk)
         
-        self._log_info("=" * 80)
-        self._log_info(f"Starting provisioning for device: {device.name}")
-        self._log_info("=" * 80)
+        # Each logger call is a JobLogEntry row - group informational lines
+        self._log_info("\n".join(["=" * 80, f"Starting provisioning for device: {device.name}", "=" * 80]))
 
         # Validate device has required attributes
         if not self._validate_device(device):
@@ -99,9 +122,12 @@ class ProvisionDevice(Job):
             commit_changes
         )
 
-        self._log_info("=" * 80)
-        self.logger.success(f"Provisioning completed for {device.name}")
-        self._log_info("=" * 80)
+        # Separators are debug output (see _log_info) - log them in the same
+        # entry as the success message
+        message = f"Provisioning completed for {device.name}"
+        if getattr(self, '_show_debug', False):
+            message = "\n".join(["=" * 80, message, "=" * 80])
+        self.logger.success(message)
 
     def _log_info(self, message):
         """Log info message only if debug mode is enabled."""
@@ -137,8 +163,6 @@ class ProvisionDevice(Job):
 
     def _get_credentials(self, device):
         """Get device credentials from secrets or use defaults."""
-        from nautobot.extras.choices import SecretsGroupAccessTypeChoices, SecretsGroupSecretTypeChoices
-        
         username = "admin"
         password = "admin"
 
@@ -193,26 +217,25 @@ class ProvisionDevice(Job):
                     f"Secrets group '{device.secrets_group.name}' is configured but "
                     "secrets could not be retrieved. Using default credentials (admin/admin)."
                 )
-                self._log_info("")
-                self._log_info("To fix this, you have two options:")
-                self._log_info("")
-                self._log_info("Option 1: Set environment variables in Nautobot")
-                self._log_info("  Add to docker-compose.yml or nautobot_config.py:")
-                self._log_info("  NAUTOBOT_NAPALM_USERNAME=admin")
-                self._log_info("  NAUTOBOT_NAPALM_PASSWORD=admin")
-                self._log_info("")
-                self._log_info("Option 2: Change secrets to use Text provider instead")
-                self._log_info("  Secrets → Secrets → Edit each secret")
-                self._log_info("  Change provider from 'environment-variable' to 'text-file' or other")
-                self._log_info("")
-                self._log_info("For this lab, default credentials (admin/admin) will work fine!")
-                self._log_info("")
+                self._log_info(
+                    "\n"
+                    "To fix this, you have two options:\n"
+                    "\n"
+                    "Option 1: Set environment variables in Nautobot\n"
+                    "  Add to docker-compose.yml or nautobot_config.py:\n"
+                    "  NAUTOBOT_NAPALM_USERNAME=admin\n"
+                    "  NAUTOBOT_NAPALM_PASSWORD=admin\n"
+                    "\n"
+                    "Option 2: Change secrets to use Text provider instead\n"
+                    "  Secrets → Secrets → Edit each secret\n"
+                    "  Change provider from 'environment-variable' to 'text-file' or other\n"
+                    "\n"
+                    "For this lab, default credentials (admin/admin) will work fine!\n"
+                )
         else:
             self._log_info(
                 "No secrets group configured for this device. "
-                "Using default credentials (admin/admin)"
-            )
-            self._log_info(
+                "Using default credentials (admin/admin)\n"
                 "Tip: Assign a secrets group in the device settings for production use"
             )
 
@@ -226,92 +249,88 @@ class ProvisionDevice(Job):
 
     def _get_intended_config(self, device):
         """Get intended configuration from Golden Config plugin."""
-        self._log_info("-" * 80)
-        self._log_info("Generating intended configuration from Golden Config...")
+        self._log_info("\n".join(["-" * 80, "Generating intended configuration from Golden Config..."]))
 
+        if not GOLDEN_CONFIG_AVAILABLE:
+            self.logger.error(
+                "Golden Config plugin is not installed. "
+                "Please install nautobot-golden-config plugin."
+            )
+            return None
+
+        # Try to get existing Golden Config record
         try:
-            # Import Golden Config models
-            from nautobot_golden_config.models import GoldenConfig
+            # Only load the columns used below (skips backup/compliance configs)
+            golden_config = GoldenConfig.objects.only(
+                "intended_config", "intended_last_success_date"
+            ).get(device=device)
             
-            # Try to get existing Golden Config record
-            try:
-                golden_config = GoldenConfig.objects.get(device=device)
+            if golden_config.intended_config:
+                # Get last update timestamp if available
+                last_update = getattr(golden_config, 'intended_last_success_date', None)
+                if not last_update:
+                    last_update = getattr(golden_config, 'last_modified', 'unknown')
                 
-                if golden_config.intended_config:
-                    # Get last update timestamp if available
-                    last_update = getattr(golden_config, 'intended_last_success_date', None)
-                    if not last_update:
-                        last_update = getattr(golden_config, 'last_modified', 'unknown')
-                    
-                    self.logger.success(
-                        f"Found existing intended config "
-                        f"(last updated: {last_update})"
-                    )
-                    
-                    # Log first few lines of config
-                    config_preview = "\n".join(
-                        golden_config.intended_config.split("\n")[:10]
-                    )
-                    self._log_info(f"Config preview:\n{config_preview}\n...")
-                    
-                    return golden_config.intended_config
-                else:
-                    self.logger.warning(
-                        "Golden Config record exists but has no intended config"
-                    )
-                    
-            except GoldenConfig.DoesNotExist:
-                self.logger.warning(
-                    f"No Golden Config record found for {device.name}"
+                self.logger.success(
+                    f"Found existing intended config "
+                    f"(last updated: {last_update})"
                 )
-
-            # Try to generate config using Golden Config plugin
-            self._log_info("Attempting to generate config using Golden Config plugin...")
-            
-            try:
-                # Import the task
-                from nautobot_golden_config.utilities.helper import get_job_filter
-                from nautobot_golden_config.nornir_plays.config_intended import config_intended
                 
-                self._log_info("Generating new intended configuration...")
+                # Log first few lines of config
+                config_preview = _first_lines(golden_config.intended_config, 10)
+                self._log_info(f"Config preview:\n{config_preview}\n...")
                 
-                # This would normally be done through the Golden Config job
-                # For now, we'll inform the user to generate it first
-                self.logger.error(
-                    "Please run the Golden Config 'Generate Intended Configurations' job first"
+                return golden_config.intended_config
+            else:
+                self.logger.warning(
+                    "Golden Config record exists but has no intended config"
                 )
-                return None
                 
-            except ImportError as e:
-                self.logger.error(
-                    f"Golden Config plugin not available or not properly configured: {e}"
-                )
-                return None
+        except GoldenConfig.DoesNotExist:
+            self.logger.warning(
+                f"No Golden Config record found for {device.name}"
+            )
 
-        except ImportError:
+        # Try to generate config using Golden Config plugin
+        self._log_info("Attempting to generate config using Golden Config plugin...")
+        
+        try:
+            # Import the task
+            from nautobot_golden_config.utilities.helper import get_job_filter
+            from nautobot_golden_config.nornir_plays.config_intended import config_intended
+            
+            self._log_info("Generating new intended configuration...")
+            
+            # This would normally be done through the Golden Config job
+            # For now, we'll inform the user to generate it first
             self.logger.error(
-                "Golden Config plugin is not installed. "
-                "Please install nautobot-golden-config plugin."
+                "Please run the Golden Config 'Generate Intended Configurations' job first"
+            )
+            return None
+            
+        except ImportError as e:
+            self.logger.error(
+                f"Golden Config plugin not available or not properly configured: {e}"
             )
             return None
 
     def _deploy_config(self, device, config, username, password, dry_run, replace, commit):
         """Deploy configuration to device using NAPALM."""
-        self._log_info("-" * 80)
-        self._log_info("Connecting to device and deploying configuration...")
-
         device_ip = str(device.primary_ip4.address.ip)
         driver_name = device.platform.napalm_driver
 
-        self._log_info(f"Device IP: {device_ip}")
-        self._log_info(f"NAPALM Driver: {driver_name}")
-        self._log_info(f"Mode: {'DRY RUN' if dry_run else 'LIVE DEPLOYMENT'}")
-        self._log_info(f"Method: {'REPLACE' if replace else 'MERGE'}")
+        self._log_info("\n".join([
+            "-" * 80,
+            "Connecting to device and deploying configuration...",
+            f"Device IP: {device_ip}",
+            f"NAPALM Driver: {driver_name}",
+            f"Mode: {'DRY RUN' if dry_run else 'LIVE DEPLOYMENT'}",
+            f"Method: {'REPLACE' if replace else 'MERGE'}",
+        ]))
 
         # Parse NAPALM optional args
         optional_args = device.platform.napalm_args or {}
         if isinstance(optional_args, str):
-            import json
             optional_args = json.loads(optional_args)
 
         napalm_device = None
@@ -346,10 +365,7 @@ class ProvisionDevice(Job):
             diff = napalm_device.compare_config()
 
             if diff:
-                self._log_info("Configuration changes:")
-                self._log_info("-" * 80)
-                self._log_info(diff)
-                self._log_info("-" * 80)
+                self._log_info("\n".join(["Configuration changes:", "-" * 80, diff, "-" * 80]))
             else:
                 self._log_info("No configuration changes detected")
                 napalm_device.discard_config()